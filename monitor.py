@@ -15,16 +15,28 @@ import os
 import re
 import time
 import json
+import heapq
 import logging
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
 from email.utils import parsedate_to_datetime
+from functools import lru_cache
+from operator import itemgetter
 from typing import Optional
-from urllib.parse import quote
+from urllib.parse import quote, urlsplit
 
 import feedparser
+import orjson
 import requests
 from dotenv import load_dotenv
 
+try:
+    # Optional: RE2 scans the fused "any signal?" prefilters in linear time
+    import re2
+except ImportError:
+    re2 = None
+
 load_dotenv()
 
 logging.basicConfig(
@@ -64,6 +76,16 @@ POSITIVE_SIGNALS = [
     r"(cruise|ballistic)\s+missiles?\s+(hit|struck|target|launched).{0,30}iran",
 ]
 
+# Negative signals decisive enough that positive signals are not counted at all
+# (betting/market chatter and opinion pieces about a strike, not reports of one)
+KILL_SIGNALS = [
+    r"betting\s+odds",
+    r"polymarket",
+    r"prediction\s+market",
+    r"opinion\b",
+    r"editorial\b",
+]
+
 # Phrases that indicate this is NOT the event we're looking for
 NEGATIVE_SIGNALS = [
     r"cyber\s*(attack|war|strike|operation)",
@@ -90,15 +112,11 @@ NEGATIVE_SIGNALS = [
     r"preparing\s+to",
     r"ready\s+to\s+strike",
     r"will\s+(the\s+)?(us|america)\s+strike",
-    r"betting\s+odds",
-    r"polymarket",
-    r"prediction\s+market",
     r"odds\s+of",
     r"probability",
     r"should\s+(the\s+)?(us|america)\s+strike",
-    r"opinion\b",
-    r"editorial\b",
     r"analysis\b",
+    *KILL_SIGNALS,
 ]
 
 # Sources to completely ignore (self-referencing noise)
@@ -107,6 +125,9 @@ IGNORED_SOURCES = {"polymarket", "predictit", "kalshi", "metaculus"}
 # Only consider articles published within this window
 MAX_ARTICLE_AGE_HOURS = 24
 
+# Upper bound for the polling interval when quiet cycles back off
+MAX_INTERVAL_SECONDS = 30 * 60
+
 # Sources we consider highly credible for military reporting
 CREDIBLE_SOURCES = {
     "reuters", "associated press", "ap news", "bbc", "cnn", "al jazeera",
@@ -120,6 +141,44 @@ CREDIBLE_SOURCES = {
 # RSS Layer (free, unlimited)
 # ---------------------------------------------------------------------------
 
+# Search URLs for RSS_QUERIES, encoded once at import
+RSS_URLS = [
+    f"https://news.google.com/rss/search?q={quote(q)}&hl=en-US&gl=US&ceid=US:en"
+    for q in RSS_QUERIES
+]
+
+# Shared HTTP session so connections to Google News and NewsData.io are reused
+_SESSION = requests.Session()
+_SESSION.headers["User-Agent"] = feedparser.USER_AGENT
+
+# Per-feed (etag, last_modified, entries) from the last successful fetch, used
+# for conditional requests so unchanged feeds come back as an empty 304
+_FEED_CACHE: dict[str, tuple[Optional[str], Optional[str], list]] = {}
+
+
+def compile_sources(sources: set[str]):
+    """Build one pattern that matches any of the (lowercase) source names as a substring."""
+    return re.compile("|".join(re.escape(s) for s in sorted(sources)))
+
+
+def source_matcher(sources: set[str]):
+    """
+    Return a memoized predicate telling whether a source name contains any of
+    `sources`. Only a few dozen outlets show up across hundreds of articles,
+    so after the first sighting each check is a single dict lookup.
+    """
+    search = compile_sources(sources).search
+
+    @lru_cache(maxsize=4096)
+    def matches(source: str) -> bool:
+        return search(source) is not None
+
+    return matches
+
+
+is_ignored_source = source_matcher(IGNORED_SOURCES)
+
+
 def parse_pub_date(date_str: str) -> Optional[datetime]:
     """Try to parse an RSS publication date into a timezone-aware datetime."""
     if not date_str:
@@ -130,45 +189,103 @@ def parse_pub_date(date_str: str) -> Optional[datetime]:
         return None
 
 
-def is_recent(article: dict) -> bool:
-    """Return True if the article was published within MAX_ARTICLE_AGE_HOURS."""
+def recency_cutoff() -> datetime:
+    """Return the oldest publication time still considered recent."""
+    return datetime.now(timezone.utc) - timedelta(hours=MAX_ARTICLE_AGE_HOURS)
+
+
+def is_recent(article: dict, cutoff: datetime) -> bool:
+    """Return True if the article was published after `cutoff`."""
     dt = parse_pub_date(article.get("published", ""))
     if dt is None:
         return True  # If we can't parse the date, include it (fail open)
-    cutoff = datetime.now(timezone.utc) - timedelta(hours=MAX_ARTICLE_AGE_HOURS)
     return dt >= cutoff
 
 
-def fetch_google_news_rss(query: str) -> list[dict]:
-    """Fetch articles from Google News RSS for a search query."""
-    url = f"https://news.google.com/rss/search?q={quote(query)}&hl=en-US&gl=US&ceid=US:en"
-    feed = feedparser.parse(url)
+def dedup_key(article: dict) -> int:
+    """
+    Hash an article's link without its query string or fragment, so the same
+    story returned with different tracking parameters is only kept once.
+    Falls back to the title when there is no link.
+    """
+    link = article.get("link", "")
+    if not link:
+        return hash(article.get("title", ""))
+    parts = urlsplit(link)
+    return hash((parts.netloc, parts.path))
+
+
+def fetch_google_news_rss(url: str, cutoff: datetime) -> tuple[list[tuple[int, dict]], list[int]]:
+    """
+    Fetch articles published after `cutoff` from a Google News RSS search URL.
+
+    Returns the recent articles as (dedup key, article) pairs, plus the dedup
+    keys of every non-ignored entry read, recent or not, so the caller can
+    report how many unique articles were scanned.
+    """
+    cached = _FEED_CACHE.get(url)
+    headers = {}
+    if cached:
+        etag, modified, _ = cached
+        if etag:
+            headers["If-None-Match"] = etag
+        if modified:
+            headers["If-Modified-Since"] = modified
+
+    try:
+        resp = _SESSION.get(url, headers=headers, timeout=15)
+        resp.raise_for_status()
+    except requests.RequestException as e:
+        log.error(f"RSS request failed for {url}: {e}")
+        return [], []
+
+    if resp.status_code == 304 and cached:
+        entries = cached[2]
+    else:
+        response_headers = {k.lower(): v for k, v in resp.headers.items()}
+        entries = feedparser.parse(resp.content, response_headers=response_headers).entries
+        _FEED_CACHE[url] = (resp.headers.get("ETag"), resp.headers.get("Last-Modified"), entries)
+
     articles = []
-    for entry in feed.entries:
+    scanned_keys = []
+    for entry in entries:
         source = entry.get("source", {}).get("title", "").lower() if hasattr(entry, "source") else ""
-        if any(ign in source for ign in IGNORED_SOURCES):
+        if is_ignored_source(source):
+            continue
+        key = dedup_key(entry)
+        scanned_keys.append(key)
+        # Google News orders search results by relevance, not date, so old
+        # entries are skipped rather than ending the scan
+        if not is_recent(entry, cutoff):
             continue
-        articles.append({
+        articles.append((key, {
             "title": entry.get("title", ""),
             "link": entry.get("link", ""),
             "published": entry.get("published", ""),
             "source": source,
-        })
-    return articles
+        }))
+    return articles, scanned_keys
 
 
-def poll_rss() -> list[dict]:
-    """Poll all RSS queries and deduplicate results."""
-    seen_links = set()
+def poll_rss(cutoff: datetime) -> tuple[list[dict], int]:
+    """
+    Poll all RSS queries concurrently and deduplicate recent results.
+    Returns the recent articles and the number of unique articles scanned.
+    """
+    seen = set()
+    scanned = set()
     all_articles = []
-    for query in RSS_QUERIES:
-        articles = fetch_google_news_rss(query)
-        for a in articles:
-            if a["link"] not in seen_links:
-                seen_links.add(a["link"])
+    with ThreadPoolExecutor(max_workers=len(RSS_URLS)) as pool:
+        results = list(pool.map(lambda url: fetch_google_news_rss(url, cutoff), RSS_URLS))
+    for articles, scanned_keys in results:
+        scanned.update(scanned_keys)
+        for key, a in articles:
+            if key not in seen:
+                seen.add(key)
                 all_articles.append(a)
-    log.info(f"RSS returned {len(all_articles)} unique articles")
-    return all_articles
+    log.info(f"RSS returned {len(scanned)} unique articles")
+    log.info(f"Filtered to {len(all_articles)} articles from last {MAX_ARTICLE_AGE_HOURS}h")
+    return all_articles, len(scanned)
 
 
 # ---------------------------------------------------------------------------
@@ -188,9 +305,9 @@ def fetch_newsdata(query: str) -> list[dict]:
         "language": "en",
     }
     try:
-        resp = requests.get(url, params=params, timeout=15)
+        resp = _SESSION.get(url, params=params, timeout=15)
         resp.raise_for_status()
-        data = resp.json()
+        data = orjson.loads(resp.content)
         articles = []
         for item in data.get("results", []):
             articles.append({
@@ -202,7 +319,7 @@ def fetch_newsdata(query: str) -> list[dict]:
             })
         log.info(f"NewsData.io returned {len(articles)} articles")
         return articles
-    except requests.RequestException as e:
+    except (requests.RequestException, orjson.JSONDecodeError) as e:
         log.error(f"NewsData.io request failed: {e}")
         return []
 
@@ -211,34 +328,134 @@ def fetch_newsdata(query: str) -> list[dict]:
 # Scoring Engine
 # ---------------------------------------------------------------------------
 
-def score_article(article: dict) -> dict:
+def compile_signals(patterns: list[str]) -> tuple[re.Pattern, ...]:
+    """
+    Compile each signal pattern on its own. Every pattern is searched
+    independently, so overlapping signals each count for a point.
+    """
+    return tuple(re.compile(p) for p in patterns)
+
+
+def compile_any_signal(patterns: list[str]):
+    """
+    Fuse a list of signal patterns into one RE2 alternation. It is only used as
+    a quick "does anything match?" check before the per-pattern count, since a
+    single scan cannot count signals that overlap.
+
+    Returns None when RE2 is not installed: on the stdlib engine the fused
+    pattern gives no measurable gain over the per-pattern searches.
     """
-    Score an article for relevance to the market resolution criteria.
+    if re2 is None:
+        return None
+    return re2.compile("|".join(f"(?:{p})" for p in patterns))
+
 
-    Returns a dict with:
-      - positive_score: how many positive signal patterns matched
-      - negative_score: how many negative signal patterns matched
-      - is_credible: whether the source is in our credible list
-      - net_score: final score (positive - negative, boosted by credibility)
+def make_scorer(positive_signals, negative_signals, kill_signals, is_credible_source):
     """
-    text = f"{article.get('title', '')} {article.get('description', '')}".lower()
+    Build score_article with the compiled patterns and credibility check bound
+    as closure locals, so the hot path does no global or attribute lookups.
+    """
+    positive_searches = tuple(p.search for p in compile_signals(positive_signals))
+    # Each negative search is paired with whether it is also a kill signal
+    kill_set = set(kill_signals)
+    negative_checks = tuple(
+        (p.search, p.pattern in kill_set) for p in compile_signals(negative_signals)
+    )
+    positive_any = compile_any_signal(positive_signals)
+    negative_any = compile_any_signal(negative_signals)
+
+    def score_article(article: dict) -> dict:
+        """
+        Score an article for relevance to the market resolution criteria.
+
+        Writes these fields onto the article in place and returns it:
+          - positive_score: how many positive signal patterns matched
+          - negative_score: how many negative signal patterns matched
+          - is_credible: whether the source is in our credible list
+          - net_score: final score (positive - negative, boosted by credibility)
+        """
+        get = article.get
+        # Lowercase once rather than matching case-insensitively, which
+        # would stop sre from using its literal-prefix scan
+        text = f"{get('title', '')} {get('description', '')}".lower()
+
+        # RE2's \s only matches ASCII whitespace, so the prefilters see the text
+        # with every whitespace run (including \xa0 and other Unicode spaces)
+        # collapsed to one space. That never matches less than the original text.
+        screen = " ".join(text.split()) if positive_any is not None else text
+
+        negative_hits = 0
+        killed = False
+        if negative_any is None or negative_any.search(screen):
+            for search, is_kill in negative_checks:
+                if search(text):
+                    negative_hits += 1
+                    killed = killed or is_kill
+
+        # Articles with a kill phrase skip the positive scan entirely
+        if killed or (positive_any is not None and not positive_any.search(screen)):
+            positive_hits = 0
+        else:
+            positive_hits = sum(1 for search in positive_searches if search(text))
+
+        # Sources are already lowercased when fetched
+        is_credible = is_credible_source(get("source", ""))
+
+        # Credible source gets a 2x multiplier on positive signals
+        credibility_boost = 2.0 if is_credible else 1.0
+        net_score = (positive_hits * credibility_boost) - (negative_hits * 1.5)
+
+        article["positive_score"] = positive_hits
+        article["negative_score"] = negative_hits
+        article["is_credible"] = is_credible
+        article["net_score"] = net_score
+        return article
+
+    return score_article
+
+
+is_credible_source = source_matcher(CREDIBLE_SOURCES)
+
+score_article = make_scorer(
+    POSITIVE_SIGNALS,
+    NEGATIVE_SIGNALS,
+    KILL_SIGNALS,
+    is_credible_source,
+)
 
-    positive_hits = sum(1 for p in POSITIVE_SIGNALS if re.search(p, text))
-    negative_hits = sum(1 for p in NEGATIVE_SIGNALS if re.search(p, text))
 
-    source = article.get("source", "").lower()
-    is_credible = any(cs in source for cs in CREDIBLE_SOURCES)
+# Scores of recently seen articles, keyed by the fields score_article reads.
+# The signal and source lists are fixed at runtime, so entries never go stale.
+SCORE_CACHE_SIZE = 10_000
+_SCORE_CACHE: OrderedDict[tuple[str, str, str], tuple] = OrderedDict()
 
-    # Credible source gets a 2x multiplier on positive signals
-    credibility_boost = 2.0 if is_credible else 1.0
-    net_score = (positive_hits * credibility_boost) - (negative_hits * 1.5)
 
-    return {
-        "positive_score": positive_hits,
-        "negative_score": negative_hits,
-        "is_credible": is_credible,
-        "net_score": net_score,
-    }
+def score_articles(articles: list[dict]) -> list[dict]:
+    """
+    Score a batch of articles in place and return the same list, reusing
+    cached results for articles already seen in an earlier cycle.
+    """
+    cache = _SCORE_CACHE
+    cache_get = cache.get
+    move_to_end = cache.move_to_end
+    score = score_article
+
+    for article in articles:
+        get = article.get
+        key = (get("title", ""), get("description", ""), get("source", ""))
+        cached = cache_get(key)
+        if cached is not None:
+            move_to_end(key)
+            (article["positive_score"], article["negative_score"],
+             article["is_credible"], article["net_score"]) = cached
+        else:
+            score(article)
+            cache[key] = (article["positive_score"], article["negative_score"],
+                          article["is_credible"], article["net_score"])
+
+    while len(cache) > SCORE_CACHE_SIZE:
+        cache.popitem(last=False)
+    return articles
 
 
 # ---------------------------------------------------------------------------
@@ -253,14 +470,15 @@ def evaluate(scored_articles: list[dict]) -> dict:
     """
     hits = [a for a in scored_articles if a["net_score"] > 0]
     credible_hits = [a for a in hits if a["is_credible"]]
-    top = hits[:5]
+    top = heapq.nlargest(5, hits, key=itemgetter("net_score"))
 
     # Tier 1: Even a single credible source with a strong signal
-    if any(a["net_score"] >= 3 and a["is_credible"] for a in hits):
+    if any(a["net_score"] >= 3 for a in credible_hits):
+        strongest = max(credible_hits, key=itemgetter("net_score"))
         return {
             "result": True,
             "confidence": 0.9,
-            "reason": f"Strong signal from credible source ({credible_hits[0].get('source', 'unknown')})",
+            "reason": f"Strong signal from credible source ({strongest.get('source', 'unknown')})",
             "top_articles": top,
         }
 
@@ -308,25 +526,33 @@ LOGS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "logs")
 
 
 def save_result(result: dict):
-    """Save the full result (including all articles) to a timestamped JSON file."""
+    """
+    Save the full result to a timestamped JSON Lines file: the first line is
+    the scan summary, followed by one line per article.
+    """
     os.makedirs(LOGS_DIR, exist_ok=True)
     timestamp = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
-    filename = f"scan_{timestamp}.json"
+    filename = f"scan_{timestamp}.jsonl"
     filepath = os.path.join(LOGS_DIR, filename)
 
-    output = {
+    # Highest-scoring articles first, as the scan log has always been ordered
+    articles = sorted(result.get("all_articles", []), key=itemgetter("net_score"), reverse=True)
+    header = {
         "ran_at": datetime.now(timezone.utc).isoformat(),
         "result": result["result"],
         "confidence": result["confidence"],
         "reason": result["reason"],
         "total_scanned": result.get("total_scanned", 0),
         "total_recent": result.get("total_recent", 0),
-        "total_with_signal": len([a for a in result.get("all_articles", []) if a["net_score"] > 0]),
-        "articles": result.get("all_articles", []),
+        "total_with_signal": sum(1 for a in articles if a["net_score"] > 0),
     }
 
-    with open(filepath, "w") as f:
-        json.dump(output, f, indent=2, default=str)
+    with open(filepath, "wb") as f:
+        f.write(orjson.dumps(header, default=str))
+        f.write(b"\n")
+        for article in articles:
+            f.write(orjson.dumps(article, default=str))
+            f.write(b"\n")
 
     log.info(f"Results saved to {filepath}")
     return filepath
@@ -339,46 +565,46 @@ def save_result(result: dict):
 def check_once(use_newsdata: bool = True) -> dict:
     """Run one check cycle: poll RSS, optionally confirm with NewsData.io."""
 
-    # Layer 1: Free RSS polling
-    rss_articles = poll_rss()
-
-    # Filter to recent articles only
-    recent_articles = [a for a in rss_articles if is_recent(a)]
-    log.info(f"Filtered to {len(recent_articles)} articles from last {MAX_ARTICLE_AGE_HOURS}h")
+    # Layer 1: Free RSS polling, recent articles only
+    rss_articles, total_scanned = poll_rss(recency_cutoff())
 
     # Score all recent articles
-    scored = []
-    for article in recent_articles:
-        score = score_article(article)
-        scored.append({**article, **score})
-
-    # Sort by net score descending
-    scored.sort(key=lambda x: x["net_score"], reverse=True)
+    scored = list(score_articles(rss_articles))
 
     # Layer 2: If RSS found promising signals, confirm with NewsData.io
-    top_rss_score = scored[0]["net_score"] if scored else 0
+    top_rss_score = max((a["net_score"] for a in scored), default=0)
     if use_newsdata and top_rss_score > 0:
         log.info("RSS found positive signals — confirming with NewsData.io")
-        newsdata_articles = fetch_newsdata(NEWSDATA_QUERY)
-        for article in newsdata_articles:
-            score = score_article(article)
-            scored.append({**article, **score})
-        scored.sort(key=lambda x: x["net_score"], reverse=True)
+        scored.extend(score_articles(fetch_newsdata(NEWSDATA_QUERY)))
 
     result = evaluate(scored)
     result["all_articles"] = scored
-    result["total_scanned"] = len(rss_articles)
-    result["total_recent"] = len(recent_articles)
+    result["total_scanned"] = total_scanned
+    result["total_recent"] = len(rss_articles)
     return result
 
 
-def monitor(interval_seconds: int = 300, use_newsdata: bool = True):
-    """Continuously monitor news, checking every `interval_seconds`."""
+def monitor(interval_seconds: int = 300, use_newsdata: bool = True,
+            max_interval_seconds: int = MAX_INTERVAL_SECONDS):
+    """
+    Continuously monitor news, checking every `interval_seconds`.
+
+    After a cycle with no positively scored article the wait doubles, up to
+    `max_interval_seconds`; any positive article resets it to the base interval.
+    """
     log.info(f"Starting monitor — checking every {interval_seconds}s")
+    max_interval_seconds = max(max_interval_seconds, interval_seconds)
+    sleep_seconds = interval_seconds
     while True:
         try:
             result = check_once(use_newsdata=use_newsdata)
             save_result(result)
+
+            if any(a["net_score"] > 0 for a in result["all_articles"]):
+                sleep_seconds = interval_seconds
+            else:
+                sleep_seconds = min(sleep_seconds * 2, max_interval_seconds)
+                log.info(f"No positive signals — next check in {sleep_seconds}s")
             timestamp = datetime.now(timezone.utc).isoformat()
             summary = {k: v for k, v in result.items() if k not in ("all_articles",)}
             print(json.dumps({"timestamp": timestamp, **summary}, indent=2))
@@ -394,7 +620,7 @@ def monitor(interval_seconds: int = 300, use_newsdata: bool = True):
         except Exception as e:
             log.error(f"Check failed: {e}")
 
-        time.sleep(interval_seconds)
+        time.sleep(sleep_seconds)
 
 
 # ---------------------------------------------------------------------------
@@ -407,6 +633,8 @@ if __name__ == "__main__":
     parser = argparse.ArgumentParser(description="Monitor: US Strikes Iran")
     parser.add_argument("--once", action="store_true", help="Run a single check and exit")
     parser.add_argument("--interval", type=int, default=300, help="Seconds between checks (default: 300)")
+    parser.add_argument("--max-interval", type=int, default=MAX_INTERVAL_SECONDS,
+                        help=f"Longest back-off between quiet checks (default: {MAX_INTERVAL_SECONDS})")
     parser.add_argument("--no-newsdata", action="store_true", help="Skip NewsData.io (RSS only)")
     args = parser.parse_args()
 
@@ -417,4 +645,5 @@ if __name__ == "__main__":
         print(json.dumps(summary, indent=2))
         print(f"\nFull results with all articles saved to: {filepath}")
     else:
-        monitor(interval_seconds=args.interval, use_newsdata=not args.no_newsdata)
+        monitor(interval_seconds=args.interval, use_newsdata=not args.no_newsdata,
+                max_interval_seconds=args.max_interval)
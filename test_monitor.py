@@ -0,0 +1,31 @@
+import unittest
+
+from monitor import score_article
+
+
+class ScoreArticleTest(unittest.TestCase):
+    def score(self, title: str, source: str = "reuters") -> float:
+        return score_article({"title": title, "source": source})["net_score"]
+
+    def test_overlapping_positive_signals_each_count(self):
+        # "us launched airstrikes against iran" matches two positive signals
+        self.assertEqual(self.score("US launched airstrikes against Iran"), 4.0)
+
+    def test_hypothetical_headline_scores_negative(self):
+        # "what if" and "if the us strikes" overlap; both must be counted
+        self.assertEqual(self.score("What if the US strikes Iran?"), -1.0)
+
+    def test_unicode_spaces_match_like_ascii_spaces(self):
+        # Feed titles often contain non-breaking or thin spaces; the optional
+        # RE2 prefilter must not hide matches the per-pattern search finds
+        self.assertEqual(self.score("US\xa0strikes Iran"), 2.0)
+        self.assertEqual(self.score("US strikes\u2009Iran"), 2.0)
+
+    def test_kill_phrase_skips_positive_signals(self):
+        article = score_article({"title": "Opinion: US strikes Iran", "source": "reuters"})
+        self.assertEqual(article["positive_score"], 0)
+        self.assertEqual(article["negative_score"], 1)
+
+
+if __name__ == "__main__":
+    unittest.main()